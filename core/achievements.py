@@ -272,8 +272,8 @@ class AchievementTracker:
         # Zen Master - zen theme for 10 minutes
         if context.get("current_theme") == "zen":
             if self.zen_start_time is None:
-                self.zen_start_time = time.time()
-            elif time.time() - self.zen_start_time >= 600:
+                self.zen_start_time = time.monotonic()
+            elif time.monotonic() - self.zen_start_time >= 600:
                 ach = self.unlock("zen_master")
                 if ach:
                     newly_unlocked.append(ach)
@@ -9,7 +9,7 @@ import time
 import random
 import sys
 import shutil
-from typing import Optional, Callable
+from typing import Optional, Callable, Sequence
 from rich.console import Console
 from rich.live import Live
 from rich.text import Text
@@ -320,7 +320,7 @@ class Animator:
 class ThinkingContext:
     """Context manager for thinking animation"""
     
-    def __init__(self, console: Console, message: str, frames: list, style: str):
+    def __init__(self, console: Console, message: str, frames: Sequence[str], style: str):
         self.console = console
         self.message = message
         self.frames = frames
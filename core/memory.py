@@ -7,7 +7,7 @@ Tracks achievements and provides session summaries.
 
 import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from dataclasses import dataclass, field
 
 
@@ -86,6 +86,10 @@ class ConversationMemory:
         self.current_mode: str = "friendly"
         self.current_theme: str = "neon"
         self._last_user_message_time: float = 0
+        
+        # Candidates for get_memorable_moment, kept in step with
+        # self.messages so the summary never rescans the history
+        self._memorable: List[Message] = []
     
     def add_message(self, role: str, content: str, mood: str = "neutral"):
         """Add a message to conversation history"""
@@ -100,6 +104,8 @@ class ConversationMemory:
         if role == "user":
             self.stats.user_message_count += 1
             self._last_user_message_time = timestamp
+            if self._is_memorable(message):
+                self._memorable.append(message)
         else:
             self.stats.ai_message_count += 1
             # Check for fast reply
@@ -111,6 +117,12 @@ class ConversationMemory:
         # Trim history if too long
         if len(self.messages) > self.max_history:
             self.messages = self.messages[-self.max_history:]
+            self._memorable = [msg for msg in self.messages if self._is_memorable(msg)]
+    
+    @staticmethod
+    def _is_memorable(msg: Message) -> bool:
+        """Longer user messages are candidates for the memorable moment"""
+        return msg.role == "user" and len(msg.content) > 30
     
     def get_context(self, last_n: int = 10) -> List[dict]:
         """Get recent conversation context for AI"""
@@ -133,6 +145,7 @@ class ConversationMemory:
     def clear(self):
         """Clear conversation history"""
         self.messages = []
+        self._memorable = []
         # Keep stats but reset message count
         old_stats = self.stats
         self.stats = SessionStats()
@@ -199,15 +212,10 @@ class ConversationMemory:
         if len(self.messages) < 3:
             return None
         
-        # Find longer, meaningful messages
-        good_messages = [
-            msg for msg in self.messages 
-            if msg.role == "user" and len(msg.content) > 30
-        ]
-        
-        if good_messages:
+        # Longer, meaningful messages (maintained by add_message)
+        if self._memorable:
             import random
-            return random.choice(good_messages).content[:80]
+            return random.choice(self._memorable).content[:80]
         
         return None
     
@@ -227,28 +235,28 @@ class ConversationMemory:
             "memorable_moment": self.get_memorable_moment(),
         }
     
-    def export_txt(self) -> str:
-        """Export conversation as plain text"""
-        lines = [
+    def iter_export_txt(self) -> Iterator[str]:
+        """Yield the plain text export one message at a time"""
+        yield "\n".join([
             f"NovaMind Chat Export",
             f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
             f"Duration: {self.stats.get_duration_formatted()}",
             "=" * 50,
             ""
-        ]
+        ])
         
         for msg in self.messages:
             role = "You" if msg.role == "user" else "NovaMind"
             time_str = datetime.fromtimestamp(msg.timestamp).strftime("%H:%M")
-            lines.append(f"[{time_str}] {role}:")
-            lines.append(msg.content)
-            lines.append("")
-        
-        return "\n".join(lines)
+            yield f"\n[{time_str}] {role}:\n{msg.content}\n"
     
-    def export_markdown(self) -> str:
-        """Export conversation as Markdown"""
-        lines = [
+    def export_txt(self) -> str:
+        """Export conversation as plain text"""
+        return "".join(self.iter_export_txt())
+    
+    def iter_export_markdown(self) -> Iterator[str]:
+        """Yield the Markdown export one message at a time"""
+        yield "\n".join([
             "# NovaMind Chat Export",
             "",
             f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}",
@@ -257,17 +265,16 @@ class ConversationMemory:
             "",
             "---",
             ""
-        ]
+        ])
         
         for msg in self.messages:
             role = "**You**" if msg.role == "user" else "**🤖 NovaMind**"
             time_str = datetime.fromtimestamp(msg.timestamp).strftime("%H:%M")
-            lines.append(f"### {role} `{time_str}`")
-            lines.append("")
-            lines.append(msg.content)
-            lines.append("")
-        
-        return "\n".join(lines)
+            yield f"\n### {role} `{time_str}`\n\n{msg.content}\n"
+    
+    def export_markdown(self) -> str:
+        """Export conversation as Markdown"""
+        return "".join(self.iter_export_markdown())
     
     def export_json(self) -> dict:
         """Export conversation as JSON-serializable dict"""
@@ -21,6 +21,14 @@ class MoodState:
     speed_modifier: float  # Typing speed modifier
 
 
+@dataclass
+class MoodAnalysis:
+    """Everything the conversation pipeline needs from one message"""
+    mood: MoodState
+    is_question: bool
+    tone_hint: str
+
+
 # ============================================
 # MOOD DEFINITIONS
 # ============================================
@@ -82,6 +90,46 @@ MOOD_PATTERNS: Dict[str, List[str]] = {
 }
 
 
+# One compiled alternation per mood; counting its matches gives the same
+# score as running each keyword pattern separately (patterns within a
+# mood never overlap)
+MOOD_REGEXES: Dict[str, "re.Pattern[str]"] = {
+    mood_name: re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    for mood_name, patterns in MOOD_PATTERNS.items()
+}
+
+EMOJI_PATTERN = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # Emoticons
+    "\U0001F300-\U0001F5FF"  # Symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # Transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # Flags
+    "\U00002702-\U000027B0"  # Dingbats
+    "\U000024C2-\U0001F251" 
+    "]+",
+    flags=re.UNICODE
+)
+
+# Ends with "?" or opens with a question word followed by more text
+# (matched on lowercased text)
+QUESTION_PATTERN = re.compile(
+    r"\?\s*$|^\s*(?:what|why|how|when|where|who|which|whose|whom) \s*\S"
+)
+
+TONE_SUGGESTIONS: Dict[str, str] = {
+    "happy": "cheerful and enthusiastic",
+    "excited": "energetic and excited",
+    "sad": "empathetic and supportive",
+    "angry": "calm and understanding",
+    "calm": "relaxed and thoughtful",
+    "curious": "informative and engaging",
+    "confused": "clear and patient",
+    "grateful": "warm and appreciative",
+    "playful": "fun and witty",
+    "neutral": "friendly and helpful",
+}
+
+
 class MoodDetector:
     """
     Detects and tracks user mood across conversation.
@@ -90,7 +138,7 @@ class MoodDetector:
     
     def __init__(self):
         self.current_mood = MOODS["neutral"]
-        self.mood_history: List[Tuple[str, float]] = []  # (mood_name, timestamp)
+        self.mood_history: List[Tuple[str, float]] = []  # (mood_name, monotonic time)
         self.message_count = 0
     
     def analyze(self, text: str) -> MoodState:
@@ -98,19 +146,24 @@ class MoodDetector:
         Analyze text and return detected mood.
         Uses pattern matching and contextual analysis.
         """
+        return self.analyze_message(text).mood
+    
+    def analyze_message(self, text: str) -> MoodAnalysis:
+        """
+        Detect mood, question-ness and response tone in one go, lowering
+        the text once and using only precompiled patterns.
+        """
         text_lower = text.lower()
         mood_scores: Dict[str, float] = {mood: 0.0 for mood in MOODS}
         
         # Check patterns for each mood
-        for mood_name, patterns in MOOD_PATTERNS.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, text_lower, re.IGNORECASE)
-                mood_scores[mood_name] += len(matches) * 0.3
+        for mood_name, regex in MOOD_REGEXES.items():
+            mood_scores[mood_name] += len(regex.findall(text_lower)) * 0.3
         
         # Analyze punctuation for intensity
         exclamation_count = text.count("!")
         question_count = text.count("?")
-        caps_ratio = sum(1 for c in text if c.isupper()) / max(len(text), 1)
+        caps_ratio = sum(map(str.isupper, text)) / max(len(text), 1)
         
         # High caps might indicate excitement or anger
         if caps_ratio > 0.5 and len(text) > 5:
@@ -126,18 +179,7 @@ class MoodDetector:
             mood_scores["curious"] += 0.3
         
         # Check for emojis
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # Emoticons
-            "\U0001F300-\U0001F5FF"  # Symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # Transport & map symbols
-            "\U0001F1E0-\U0001F1FF"  # Flags
-            "\U00002702-\U000027B0"  # Dingbats
-            "\U000024C2-\U0001F251" 
-            "]+",
-            flags=re.UNICODE
-        )
-        emojis = emoji_pattern.findall(text)
+        emojis = EMOJI_PATTERN.findall(text)
         if emojis:
             mood_scores["playful"] += 0.1 * len(emojis)
         
@@ -151,7 +193,11 @@ class MoodDetector:
         self.current_mood = MOODS[best_mood]
         self.message_count += 1
         
-        return self.current_mood
+        return MoodAnalysis(
+            mood=self.current_mood,
+            is_question=QUESTION_PATTERN.search(text_lower) is not None,
+            tone_hint=TONE_SUGGESTIONS[best_mood],
+        )
     
     def get_current_mood(self) -> MoodState:
         """Get the current detected mood"""
@@ -216,19 +262,7 @@ class MoodDetector:
     
     def suggest_response_tone(self) -> str:
         """Suggest AI response tone based on detected mood"""
-        tone_suggestions = {
-            "happy": "cheerful and enthusiastic",
-            "excited": "energetic and excited",
-            "sad": "empathetic and supportive",
-            "angry": "calm and understanding",
-            "calm": "relaxed and thoughtful",
-            "curious": "informative and engaging",
-            "confused": "clear and patient",
-            "grateful": "warm and appreciative",
-            "playful": "fun and witty",
-            "neutral": "friendly and helpful",
-        }
-        return tone_suggestions.get(self.current_mood.name, "friendly and helpful")
+        return TONE_SUGGESTIONS.get(self.current_mood.name, "friendly and helpful")
 
 
 # Global mood detector instance
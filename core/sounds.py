@@ -16,15 +16,28 @@ TYPING_SOUNDS = {
     "none": [],
 }
 
+# Size of the pre-shuffled keystroke ring (power of two for cheap wrap-around)
+SOUND_RING_SIZE = 256
+
 class SoundSimulator:
     """
     Adapter class for the new SoundEngine.
     Preserves the old API for compatibility.
     """
     
+    __slots__ = ("engine", "_style", "_ring", "_ring_i")
+    
     def __init__(self):
         self.engine = get_sound_engine()
         self._style = "mechanical"
+        self._build_sound_ring()
+    
+    def _build_sound_ring(self):
+        """Pre-shuffle keystroke visuals for the current style into a ring buffer"""
+        sounds = TYPING_SOUNDS.get(self._style, [])
+        n = len(sounds)
+        self._ring = [sounds[random.randrange(n)] for _ in range(SOUND_RING_SIZE)] if n else []
+        self._ring_i = 0
     
     @property
     def enabled(self):
@@ -43,6 +56,7 @@ class SoundSimulator:
         if style.lower() in TYPING_SOUNDS:
             self._style = style.lower()
             self.engine.style = style.lower()
+            self._build_sound_ring()
     
     def play_keystroke_sound(self):
         """Queue a keystroke sound (non-blocking)"""
@@ -54,10 +68,11 @@ class SoundSimulator:
     
     def get_keystroke_sound(self) -> str:
         """Get a random keystroke visual representation"""
-        if not self.enabled:
+        if not self.enabled or not self._ring:
             return ""
-        sounds = TYPING_SOUNDS.get(self._style, [])
-        return random.choice(sounds) if sounds else ""
+        sound = self._ring[self._ring_i & (SOUND_RING_SIZE - 1)]
+        self._ring_i += 1
+        return sound
     
     def get_enter_sound(self) -> str:
         """Get enter key sound visual"""
@@ -5,14 +5,19 @@ Dynamic theme system with multiple visual modes.
 Handles colors, gradients, and styling tokens.
 """
 
+import sys
 from rich.style import Style
 from rich.theme import Theme
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Sequence, Tuple
 import random
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older versions keep a __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ThemeColors:
     """Color palette for a theme"""
     name: str
@@ -203,106 +208,149 @@ THEMES: Dict[str, ThemeColors] = {
 }
 
 
+def _build_rich_theme(theme: ThemeColors) -> Theme:
+    """Build Rich library theme from a theme's colors"""
+    return Theme({
+        "primary": Style(color=theme.primary),
+        "secondary": Style(color=theme.secondary),
+        "user": Style(color=theme.user_text, bold=True),
+        "ai": Style(color=theme.ai_text),
+        "system": Style(color=theme.system_text, italic=True),
+        "error": Style(color=theme.error_text, bold=True),
+        "border": Style(color=theme.border),
+        "highlight": Style(color=theme.highlight, bold=True),
+        "muted": Style(color=theme.muted),
+        "success": Style(color="bright_green", bold=True),
+        "warning": Style(color="bright_yellow"),
+        "info": Style(color="bright_cyan"),
+    })
+
+
+# Rich themes are built once at import so switching is just a lookup
+_RICH_THEMES: Dict[str, Theme] = {
+    name: _build_rich_theme(colors) for name, colors in THEMES.items()
+}
+
+_THEME_NAMES: Tuple[str, ...] = tuple(THEMES.keys())
+
+# Private generator for cosmetic picks (theme shuffles etc.)
+_RNG = random.Random()
+
+
+def _pick(seq: Sequence[str]) -> str:
+    """
+    Pick a random element using Lemire's multiply-shift bound.
+    
+    Maps 32 random bits onto [0, len(seq)) with one multiply, avoiding
+    the rejection loop behind random.choice. The bias is negligible for
+    the tiny sequences used here.
+    """
+    return seq[(_RNG.getrandbits(32) * len(seq)) >> 32]
+
+
+# ============================================
+# ANIMATION / DRAWING CHARACTER SETS
+# ============================================
+
+_SPINNERS: Dict[str, Tuple[str, ...]] = {
+    "dots": ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"),
+    "braille": ("⣾", "⣽", "⣻", "⢿", "⡿", "⣟", "⣯", "⣷"),
+    "moon": ("🌑", "🌒", "🌓", "🌔", "🌕", "🌖", "🌗", "🌘"),
+    "arrows": ("←", "↖", "↑", "↗", "→", "↘", "↓", "↙"),
+    "bounce": ("⠁", "⠂", "⠄", "⡀", "⢀", "⠠", "⠐", "⠈"),
+    "pulse": ("█", "▓", "▒", "░", "▒", "▓"),
+}
+
+_BOXES: Dict[str, Dict[str, str]] = {
+    "rounded": {
+        "tl": "╭", "tr": "╮", "bl": "╰", "br": "╯",
+        "h": "─", "v": "│", "cross": "┼"
+    },
+    "sharp": {
+        "tl": "┌", "tr": "┐", "bl": "└", "br": "┘",
+        "h": "─", "v": "│", "cross": "┼"
+    },
+    "double": {
+        "tl": "╔", "tr": "╗", "bl": "╚", "br": "╝",
+        "h": "═", "v": "║", "cross": "╬"
+    },
+    "heavy": {
+        "tl": "┏", "tr": "┓", "bl": "┗", "br": "┛",
+        "h": "━", "v": "┃", "cross": "╋"
+    },
+}
+
+_GRADIENT_CHARS: Tuple[str, ...] = ("░", "▒", "▓", "█")
+
+_WAVEFORM_CHARS: Tuple[str, ...] = ("▁", "▂", "▃", "▄", "▅", "▆", "▇", "█")
+
+# Fixed mood colors; "neutral" (and unknown moods) use the theme's AI color
+_MOOD_COLORS: Dict[str, str] = {
+    "happy": "bright_yellow",
+    "excited": "bright_magenta",
+    "sad": "blue",
+    "angry": "bright_red",
+    "calm": "cyan",
+    "curious": "bright_cyan",
+    "confused": "yellow",
+}
+
+
 class StyleManager:
     """
     Manages the current theme and provides styling utilities.
     Supports dynamic theme switching and mood-reactive colors.
     """
     
+    __slots__ = ("current_theme_name", "theme", "rich_theme")
+    
     def __init__(self, theme_name: str = "dark"):
         self.current_theme_name = theme_name
         self.theme = THEMES.get(theme_name, THEMES["dark"])
-        self._build_rich_theme()
-    
-    def _build_rich_theme(self):
-        """Build Rich library theme from current colors"""
-        self.rich_theme = Theme({
-            "primary": Style(color=self.theme.primary),
-            "secondary": Style(color=self.theme.secondary),
-            "user": Style(color=self.theme.user_text, bold=True),
-            "ai": Style(color=self.theme.ai_text),
-            "system": Style(color=self.theme.system_text, italic=True),
-            "error": Style(color=self.theme.error_text, bold=True),
-            "border": Style(color=self.theme.border),
-            "highlight": Style(color=self.theme.highlight, bold=True),
-            "muted": Style(color=self.theme.muted),
-            "success": Style(color="bright_green", bold=True),
-            "warning": Style(color="bright_yellow"),
-            "info": Style(color="bright_cyan"),
-        })
+        self.rich_theme = _RICH_THEMES.get(theme_name, _RICH_THEMES["dark"])
     
     def switch_theme(self, theme_name: str) -> bool:
         """Switch to a different theme"""
-        if theme_name.lower() in THEMES:
-            self.current_theme_name = theme_name.lower()
-            self.theme = THEMES[theme_name.lower()]
-            self._build_rich_theme()
+        name = theme_name.lower()
+        if name in THEMES:
+            self.current_theme_name = name
+            self.theme = THEMES[name]
+            self.rich_theme = _RICH_THEMES[name]
             return True
         return False
     
-    def get_theme_names(self) -> list:
-        """Get list of available theme names"""
-        return list(THEMES.keys())
+    def get_theme_names(self) -> Tuple[str, ...]:
+        """Get available theme names (in definition order)"""
+        return _THEME_NAMES
     
     def get_random_theme(self) -> str:
         """Get a random theme name"""
-        return random.choice(list(THEMES.keys()))
+        return _pick(_THEME_NAMES)
     
     def get_mood_color(self, mood: str) -> str:
         """Get color based on detected mood"""
-        mood_colors = {
-            "happy": "bright_yellow",
-            "excited": "bright_magenta",
-            "sad": "blue",
-            "angry": "bright_red",
-            "calm": "cyan",
-            "curious": "bright_cyan",
-            "confused": "yellow",
-            "neutral": self.theme.ai_text,
-        }
-        return mood_colors.get(mood.lower(), self.theme.ai_text)
+        # Mood names arrive lowercase in practice, so try the exact key
+        # first and only pay for .lower() on a miss
+        color = _MOOD_COLORS.get(mood)
+        if color is None:
+            color = _MOOD_COLORS.get(mood.lower(), self.theme.ai_text)
+        return color
     
-    def get_gradient_chars(self) -> list:
+    def get_gradient_chars(self) -> Tuple[str, ...]:
         """Get gradient block characters for visual effects"""
-        return ["░", "▒", "▓", "█"]
+        return _GRADIENT_CHARS
     
-    def get_waveform_chars(self) -> list:
+    def get_waveform_chars(self) -> Tuple[str, ...]:
         """Get waveform characters for voice visualization"""
-        return ["▁", "▂", "▃", "▄", "▅", "▆", "▇", "█"]
+        return _WAVEFORM_CHARS
     
-    def get_spinner_frames(self, style: str = "dots") -> list:
+    def get_spinner_frames(self, style: str = "dots") -> Tuple[str, ...]:
         """Get spinner animation frames"""
-        spinners = {
-            "dots": ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"],
-            "braille": ["⣾", "⣽", "⣻", "⢿", "⡿", "⣟", "⣯", "⣷"],
-            "moon": ["🌑", "🌒", "🌓", "🌔", "🌕", "🌖", "🌗", "🌘"],
-            "arrows": ["←", "↖", "↑", "↗", "→", "↘", "↓", "↙"],
-            "bounce": ["⠁", "⠂", "⠄", "⡀", "⢀", "⠠", "⠐", "⠈"],
-            "pulse": ["█", "▓", "▒", "░", "▒", "▓"],
-        }
-        return spinners.get(style, spinners["dots"])
+        return _SPINNERS.get(style, _SPINNERS["dots"])
     
-    def get_box_chars(self, style: str = "rounded") -> dict:
+    def get_box_chars(self, style: str = "rounded") -> Dict[str, str]:
         """Get box drawing characters"""
-        boxes = {
-            "rounded": {
-                "tl": "╭", "tr": "╮", "bl": "╰", "br": "╯",
-                "h": "─", "v": "│", "cross": "┼"
-            },
-            "sharp": {
-                "tl": "┌", "tr": "┐", "bl": "└", "br": "┘",
-                "h": "─", "v": "│", "cross": "┼"
-            },
-            "double": {
-                "tl": "╔", "tr": "╗", "bl": "╚", "br": "╝",
-                "h": "═", "v": "║", "cross": "╬"
-            },
-            "heavy": {
-                "tl": "┏", "tr": "┓", "bl": "┗", "br": "┛",
-                "h": "━", "v": "┃", "cross": "╋"
-            },
-        }
-        return boxes.get(style, boxes["rounded"])
+        return _BOXES.get(style, _BOXES["rounded"])
 
 
 # Global style manager instance
@@ -25,10 +25,14 @@ ANSI by default.
 import sys
 import os
 import shutil
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 
 
-def _enable_windows_ansi():
+# Maximum number of assembled full-screen frames kept in memory
+PAINT_CACHE_SIZE = 8
+
+
+def enable_windows_ansi():
     """
     WINDOWS-SPECIFIC: Explicitly enable ANSI escape code processing.
     
@@ -82,6 +86,16 @@ class ThemeEngine:
     # Class-level singleton instance
     _instance = None
     
+    # Fixed attribute layout; slots work with the singleton __new__ since
+    # _initialized is assigned on the instance, not the class
+    __slots__ = (
+        "_initialized",
+        "_r", "_g", "_b", "_has_bg", "_bg_ansi",
+        "supports_color", "_supports_rep",
+        "_paint_cache", "_stdout_buffer", "_fd", "_use_os_write",
+        "_last_paint_key", "_dirty",
+    )
+    
     def __new__(cls):
         """Ensure only one ThemeEngine instance exists (singleton pattern)"""
         if cls._instance is None:
@@ -98,13 +112,44 @@ class ThemeEngine:
         # WINDOWS-SPECIFIC: Enable ANSI escape codes
         # This MUST happen before any ANSI output
         # ============================================
-        _enable_windows_ansi()
+        enable_windows_ansi()
             
         # ============================================
         # PERSISTENT STATE - survives all operations
         # ============================================
-        self.current_bg: Optional[Tuple[int, int, int]] = None  # RGB background
+        # Current RGB background, stored as scalars so hot paths never
+        # build or unpack a tuple (see get_current_bg for the tuple view)
+        self._r: int = 0
+        self._g: int = 0
+        self._b: int = 0
+        self._has_bg: bool = False
+        self._bg_ansi: str = ""  # ANSI sequence for the background ("" if none)
         self.supports_color: bool = self._check_color_support()
+        
+        # REP (ESC[<n>b) repeats the previous character n times, letting a
+        # row be painted with a handful of bytes instead of `width` spaces.
+        # Set NOVAMIND_NO_REP=1 for terminals that don't implement it.
+        self._supports_rep: bool = os.getenv("NOVAMIND_NO_REP") != "1"
+        
+        # Assembled full-screen frames keyed by (r, g, b, width, height, rep).
+        # Frames are pure ASCII, so they are stored pre-encoded and written
+        # straight to the binary buffer when one is available.
+        self._paint_cache: Dict[Tuple[int, ...], bytes] = {}
+        self._stdout_buffer = getattr(sys.stdout, "buffer", None)
+        
+        # On a real terminal, frames go straight to the file descriptor
+        # with os.write(), skipping Python's buffered I/O layers entirely.
+        # stdout may have no usable fd (e.g. Jupyter, captured output).
+        try:
+            self._fd: Optional[int] = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            self._fd = None
+        self._use_os_write: bool = self._fd is not None and sys.stdout.isatty()
+        
+        # Repaint skipping: a paint identical to the last one is dropped
+        # unless something has written to the screen since (see mark_dirty)
+        self._last_paint_key: Optional[Tuple[int, ...]] = None
+        self._dirty: bool = True
         self._initialized = True
         
     def _check_color_support(self) -> bool:
@@ -123,6 +168,22 @@ class ThemeEngine:
         # COLORTERM=truecolor indicates 24-bit support
         return True
     
+    def _read_terminal_size(self) -> Tuple[int, int]:
+        """Query the terminal for (columns, lines), falling back to 120x30"""
+        try:
+            term_size = shutil.get_terminal_size()
+            return term_size.columns, term_size.lines
+        except Exception:
+            # Size detection failed - cached frames may no longer fit
+            self._paint_cache.clear()
+            return 120, 30
+    
+    def _set_current_bg(self, r: int, g: int, b: int):
+        """Record the active background and its prebuilt ANSI sequence"""
+        self._r, self._g, self._b = r, g, b
+        self._has_bg = True
+        self._bg_ansi = f"\033[48;2;{r};{g};{b}m"
+    
     def get_current_bg(self) -> Optional[Tuple[int, int, int]]:
         """
         Get the current background RGB.
@@ -131,89 +192,119 @@ class ThemeEngine:
         Returns:
             Tuple of (R, G, B) or None if no theme applied
         """
-        return self.current_bg
+        return (self._r, self._g, self._b) if self._has_bg else None
+    
+    @property
+    def current_bg(self) -> Optional[Tuple[int, int, int]]:
+        """Current background RGB (read-only view, see get_current_bg)"""
+        return self.get_current_bg()
     
     def paint_full_terminal_background(self, theme=None):
         """
         MANDATORY FIX STRATEGY:
         1. Clear scrollback (ESC[3J)
-        2. Clear screen (ESC[2J)
-        3. Move cursor home (ESC[H)
-        4. Paint ENTIRE viewport
-        5. Reset cursor
+        2. Move cursor home (ESC[H)
+        3. Paint ENTIRE viewport
+        4. Reset cursor
         
         This makes the application behave like a real TUI (htop, neovim).
         
         Args:
             theme: Optional theme object with .bg_rgb attribute. 
-                   If None, uses self.current_bg.
+                   If None, uses the current background.
         """
         if not self.supports_color:
             return
 
-        # Determine RGB
-        r, g, b = None, None, None
+        # Determine RGB (a theme argument becomes the new state)
         if theme and hasattr(theme, 'bg_rgb'):
-             r, g, b = theme.bg_rgb
-        elif self.current_bg:
-             r, g, b = self.current_bg
-        
-        if r is None:
+            self._set_current_bg(*theme.bg_rgb)
+        elif not self._has_bg:
             return  # No color to paint
 
-        # Save to state if it's new
-        self.current_bg = (r, g, b)
+        bg_code = self._bg_ansi
         
-        # Build ANSI Background Code
-        bg_code = f"\033[48;2;{r};{g};{b}m"
+        # Get dimensions (read per paint: full paints are rare, and the
+        # frame cache is keyed on size so a resize never reuses a frame)
+        width, height = self._read_terminal_size()
         
-        # Get dimensions
-        try:
-            term_size = shutil.get_terminal_size()
-            width = term_size.columns
-            height = term_size.lines
-        except Exception:
-            width = 120
-            height = 30
-            
-        # ============================================
-        # MANDATORY STEP 1: FULL BUFFER RESET
-        # 1. Clear scrollback (ESC[3J)
-        # 2. Clear screen (ESC[2J)
-        # 3. Move cursor home (ESC[H)
-        # ============================================
-        sys.stdout.write(bg_code)
-        sys.stdout.write("\033[3J")  # Clear scrollback buffer
-        sys.stdout.write("\033[2J")  # Clear visible viewport
-        sys.stdout.write("\033[H")   # Move cursor to top-left
+        key = (self._r, self._g, self._b, width, height, self._supports_rep)
+        if not self._dirty and key == self._last_paint_key:
+            return  # Screen already shows exactly this frame
         
-        # ============================================
-        # MANDATORY STEP 2: TRUE FULL VIEWPORT PAINT
-        # Fill strictly (rows) lines with (columns) spaces
-        # ============================================
-        blank_line = " " * width
+        payload = self._paint_cache.get(key)
+        if payload is None:
+            payload = self._build_paint_payload(bg_code, width, height).encode("ascii")
+            if len(self._paint_cache) >= PAINT_CACHE_SIZE:
+                # Simple FIFO eviction (dicts keep insertion order)
+                self._paint_cache.pop(next(iter(self._paint_cache)))
+            self._paint_cache[key] = payload
         
-        for row in range(height):
-            # Write background code explicit on every line
-            sys.stdout.write(f"{bg_code}{blank_line}")
-            
-            # Use \r\n to ensure we start at column 0 of next line
-            # But for the last line, we prevent auto-scroll if possible
-            if row < height - 1:
-                sys.stdout.write("\n")
-                
-        # ============================================
-        # MANDATORY STEP 4: CURSOR POSITION CONTROL
-        # Move cursor back to safe UI start row (0,0) / Home
-        # ============================================
-        sys.stdout.write("\033[H")
+        self._write_payload(payload)
+        self._last_paint_key = key
+        self._dirty = False
+
+    def mark_dirty(self):
+        """
+        Note that the screen has changed since the last full paint.
         
-        # ============================================
-        # MANDATORY STEP 3: FORCE BACKGROUND ON EVERY PRINT
-        # Set background attribute strictly for future output
-        # ============================================
-        sys.stdout.write(bg_code)
-        sys.stdout.flush()
+        Called by DirtyTrackingStream on every write, so the next paint
+        is never skipped after other output.
+        """
+        self._dirty = True
+
+    def _write_payload(self, payload: bytes):
+        """
+        Emit a pre-encoded ANSI frame, bypassing text-mode encoding.
+        
+        Pending text output is flushed first so the frame lands after
+        anything Rich has already buffered.
+        """
+        if self._use_os_write:
+            sys.stdout.flush()
+            view = memoryview(payload)
+            while view:
+                # os.write may accept only part of a large frame
+                written = os.write(self._fd, view)
+                view = view[written:]
+            return
+        
+        buf = self._stdout_buffer
+        if buf is not None:
+            sys.stdout.flush()
+            buf.write(payload)
+            buf.flush()
+        else:
+            sys.stdout.write(payload.decode("ascii"))
+            sys.stdout.flush()
+
+    def _build_paint_payload(self, bg_code: str, width: int, height: int) -> str:
+        """
+        Assemble the complete ANSI frame for a full-screen paint.
+        
+        Args:
+            bg_code: ANSI background sequence for the fill color
+            width: Terminal columns
+            height: Terminal rows
+            
+        Returns:
+            The frame as a single string, ready for one write()
+        """
+        # Each row is the background code plus a row of spaces. With REP,
+        # one space is printed and the terminal repeats it across the row.
+        if self._supports_rep and width > 1:
+            blank_line = f" \033[{width - 1}b"
+        else:
+            blank_line = " " * width
+        row = bg_code + blank_line
+        # Repeating a pre-suffixed row is a single C-level copy; the last
+        # row has no newline so the terminal doesn't scroll
+        height = max(1, height)
+        body = (row + "\n") * (height - 1) + row
+        # Frame: bg, clear scrollback (3J), home (H), rows, home (H), bg
+        # (left active for later output). No 2J: the rows overwrite every
+        # cell, and clearing first flashes the default background.
+        return bg_code + "\033[3J\033[H" + body + "\033[H" + bg_code
 
     def apply_full_background(self, r: int = None, g: int = None, b: int = None):
         """
@@ -224,7 +315,7 @@ class ThemeEngine:
         # Create a temporary dummy object if needed or just update state 
         # so paint_full_terminal_background picks it up
         if r is not None and g is not None and b is not None:
-            self.current_bg = (r, g, b)
+            self._set_current_bg(r, g, b)
             
         self.paint_full_terminal_background()
 
@@ -238,34 +329,28 @@ class ThemeEngine:
         """
         Re-apply the current background without full screen fill.
         """
-        if not self.supports_color or self.current_bg is None:
+        if not self.supports_color or not self._bg_ansi:
             return
         
-        r, g, b = self.current_bg
-        bg_sequence = f"\033[48;2;{r};{g};{b}m"
-        sys.stdout.write(bg_sequence)
+        sys.stdout.write(self._bg_ansi)
         sys.stdout.flush()
 
     def ensure_background(self):
         """
         Ensure background color is active for subsequent output.
         """
-        if not self.supports_color or self.current_bg is None:
+        if not self.supports_color or not self._bg_ansi:
             return
         
-        r, g, b = self.current_bg
         # FORCE background ANSI
-        sys.stdout.write(f"\033[48;2;{r};{g};{b}m")
+        sys.stdout.write(self._bg_ansi)
         sys.stdout.flush()
 
     def get_bg_ansi_code(self) -> str:
         """
         Get the ANSI escape sequence for current background.
         """
-        if self.current_bg is None:
-            return ""
-        r, g, b = self.current_bg
-        return f"\033[48;2;{r};{g};{b}m"
+        return self._bg_ansi
 
     def clear_screen_safe(self):
         """
@@ -276,7 +361,10 @@ class ThemeEngine:
             os.system('cls' if os.name == 'nt' else 'clear')
             return
         
-        if self.current_bg is not None:
+        if self._has_bg:
+            # An explicit clear always repaints: output that bypasses
+            # DirtyTrackingStream (plain print, input echo) isn't tracked
+            self._dirty = True
             self.paint_full_terminal_background()
         else:
             sys.stdout.write("\033[3J\033[2J\033[H")
@@ -292,7 +380,9 @@ class ThemeEngine:
         sys.stdout.write("\033[0m")
         sys.stdout.write("\033[3J\033[2J\033[H") # Clear scrollback + screen
         sys.stdout.flush()
-        self.current_bg = None
+        self._has_bg = False
+        self._bg_ansi = ""
+        self._last_paint_key = None
 
     def flash_background(self, r: int, g: int, b: int, duration: float = 0.1):
         """
@@ -300,7 +390,7 @@ class ThemeEngine:
         but user requires full fill).
         """
         import time
-        saved_bg = self.current_bg
+        saved_bg = self.get_current_bg()
         self.apply_full_background(r, g, b)
         time.sleep(duration)
         if saved_bg:
@@ -309,6 +399,42 @@ class ThemeEngine:
             self.reset_background()
 
 
+class DirtyTrackingStream:
+    """
+    Text stream proxy that marks the theme engine dirty on every write.
+    
+    Hand this to Rich as the Console file (and write raw output through
+    console.file) so the engine knows when the screen no longer matches
+    its last full paint. Everything else is delegated to the live
+    sys.stdout, unwrapped from Rich's FileProxy while a status/Live
+    display redirects it.
+    """
+    
+    def __init__(self, engine: ThemeEngine):
+        self._engine = engine
+    
+    @property
+    def rich_proxied_file(self) -> "DirtyTrackingStream":
+        # Console.file unwraps this attribute; answering with ourselves keeps
+        # Rich writing through the proxy even while stdout is redirected
+        return self
+    
+    @staticmethod
+    def _stdout():
+        stdout = sys.stdout
+        return getattr(stdout, "rich_proxied_file", stdout)
+    
+    def write(self, text: str) -> int:
+        self._engine.mark_dirty()
+        return self._stdout().write(text)
+    
+    def flush(self):
+        self._stdout().flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stdout(), name)
+
+
 # ============================================
 # GLOBAL SINGLETON INSTANCE
 # ============================================
@@ -9,7 +9,12 @@ import sys
 import shutil
 import json
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
+
+
+# Write buffer for exports; large enough that a long chat is written in a
+# handful of syscalls without holding the whole file in memory.
+EXPORT_BUFFER_SIZE = 1 << 16
 
 
 def get_terminal_size() -> tuple:
@@ -90,11 +95,41 @@ def save_to_file(content: str, filename: str, directory: str = ".") -> bool:
         return False
 
 
+def save_chunks(chunks: Iterable[str], filename: str, directory: str = ".") -> bool:
+    """Stream an iterable of text chunks to a file"""
+    try:
+        filepath = os.path.join(directory, filename)
+        with open(filepath, 'w', buffering=EXPORT_BUFFER_SIZE, encoding='utf-8') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        return True
+    except Exception:
+        return False
+
+
 def save_json(data: dict, filename: str, directory: str = ".") -> bool:
     """Save data as JSON file"""
+    # Optional fast serializer, imported only when exporting
+    # (falls back to the json module if missing)
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    
     try:
         filepath = os.path.join(directory, filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            except TypeError:
+                payload = None  # types orjson rejects; let json handle them
+            if payload is not None:
+                # Already UTF-8 bytes, so no str copy. BufferedWriter hands
+                # large payloads straight to the OS and retries short writes
+                with open(filepath, 'wb') as f:
+                    f.write(payload)
+                return True
+        with open(filepath, 'w', buffering=EXPORT_BUFFER_SIZE, encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
         return True
     except Exception:
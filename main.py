@@ -20,9 +20,16 @@ Version: 1.0.0
 
 import sys
 import os
+import re
 import time
+import atexit
 import signal
+import threading
+import weakref
+from concurrent.futures import Future
 from datetime import datetime
+from functools import cached_property
+from typing import Optional
 
 # ============================================
 # WINDOWS UNICODE FIX
@@ -38,19 +45,27 @@ if sys.platform == 'win32':
         import io
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-    
-    # Enable ANSI escape sequences on Windows
-    os.system('')
 
 # Set environment variable for Rich library
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+# Enable ANSI escape sequences on Windows via SetConsoleMode
+# (cheaper than the old os.system('') trick, which spawned a shell)
+if sys.platform == 'win32':
+    from core.theme_engine import enable_windows_ansi
+    enable_windows_ansi()
 
-# Load environment variables from .env file
-from dotenv import load_dotenv
-load_dotenv()
+# Load environment variables from .env file (project root or working
+# directory); skip importing python-dotenv entirely when there is none
+for _env_path in (os.path.join(PROJECT_ROOT, '.env'), os.path.abspath('.env')):
+    if os.path.exists(_env_path):
+        from dotenv import load_dotenv
+        load_dotenv(_env_path)
+        break
 
 # Rich console for beautiful output
 from rich.console import Console
@@ -59,21 +74,91 @@ from rich.live import Live
 
 # Core modules
 from core.styles import get_style_manager, THEMES
-from core.theme_engine import get_theme_engine
-from core.animator import Animator
+from core.theme_engine import get_theme_engine, DirtyTrackingStream
 from core.ui import UI
 from core.ai_engine import get_ai_engine
 from core.memory import get_memory
 from core.mood import get_mood_detector
 from core.commands import get_command_parser
 from core.achievements import get_achievement_tracker
-from core.easter_eggs import (
-    get_easter_egg_hunter, 
-    get_random_joke, 
-    get_random_fortune, 
-    get_8ball_response
-)
-from core.utils import is_question, sanitize_input
+# Imported eagerly: the sound engine starts its worker and prints its banner
+# on import, which must happen before the first full-screen paint
+from core.sounds import get_sound_simulator
+from core.utils import sanitize_input
+
+
+# Typing animation emits one word (plus trailing whitespace) per tick;
+# runs of leading whitespace form their own token so lines round-trip exactly
+TYPING_TOKEN_PATTERN = re.compile(r"\S+\s*|\s+")
+
+# Typing delay classes: 0 = regular, 1 = sentence end, 2 = pause,
+# 3 = space, 4 = ESC (no delay). TYPING_DELAY_CLASS maps ord(char) to a
+# class for the first 256 code points; anything beyond is regular.
+TYPING_CLASS_DELAYS = (0.02, 0.08, 0.04, 0.01, 0.0)  # seconds, by class
+_delay_class = bytearray(256)
+for _char in ".!?":
+    _delay_class[ord(_char)] = 1
+for _char in ",;:":
+    _delay_class[ord(_char)] = 2
+_delay_class[ord(" ")] = 3
+_delay_class[0x1b] = 4
+TYPING_DELAY_CLASS = bytes(_delay_class)
+del _char, _delay_class
+
+# Accumulated typing delay is only slept off once it exceeds this (seconds)
+TYPING_MIN_SLEEP = 0.005
+
+
+# ============================================
+# PROCESS-WIDE EXIT HANDLING
+# ============================================
+# Signal and atexit handlers are installed once per process and reach the
+# running app through a weak reference, so constructing several NovaMind
+# instances neither stacks handlers nor keeps old instances alive.
+
+_active_app: Optional["weakref.ReferenceType"] = None
+_exit_handlers_installed = False
+
+
+def _get_active_app() -> Optional["NovaMind"]:
+    """Return the live NovaMind instance, if any"""
+    return _active_app() if _active_app is not None else None
+
+
+def _handle_exit_signal(signum, frame):
+    """SIGINT/SIGTERM handler: hand off to the app's graceful exit"""
+    app = _get_active_app()
+    if app is None:
+        # No app to shut down: behave like the default handlers
+        if signum == signal.SIGINT:
+            raise KeyboardInterrupt
+        raise SystemExit(128 + signum)
+    app._handle_interrupt(signum, frame)
+
+
+def _restore_terminal_colors():
+    """atexit hook: never leave the shell painted in theme colors"""
+    app = _get_active_app()
+    if app is None or not app.theme_engine.supports_color:
+        return
+    try:
+        sys.stdout.write("\033[0m")
+        sys.stdout.flush()
+    except (OSError, ValueError):
+        pass
+
+
+def _install_exit_handlers(app: "NovaMind"):
+    """Point the process-wide exit handlers at app, installing them once"""
+    global _active_app, _exit_handlers_installed
+    _active_app = weakref.ref(app)
+    if _exit_handlers_installed:
+        return
+    signal.signal(signal.SIGINT, _handle_exit_signal)
+    if hasattr(signal, 'SIGTERM'):
+        signal.signal(signal.SIGTERM, _handle_exit_signal)
+    atexit.register(_restore_terminal_colors)
+    _exit_handlers_installed = True
 
 
 class NovaMind:
@@ -86,33 +171,99 @@ class NovaMind:
         # Initialize console with theme
         self.style_manager = get_style_manager()
         self.theme_engine = get_theme_engine()
-        self.console = Console(theme=self.style_manager.rich_theme)
+        # Rich output goes through DirtyTrackingStream so the theme engine
+        # can skip full-screen repaints when nothing was printed since
+        self.console = Console(
+            theme=self.style_manager.rich_theme,
+            file=DirtyTrackingStream(self.theme_engine),
+        )
+        self._console_theme_pushed = False
+        
+        # Line-edited input session (None -> plain input())
+        self._prompt_session = self._create_prompt_session()
+        
+        # Per-theme prompt styling, rebuilt by _refresh_status_style
+        self._muted_open = ""
+        self._muted_close = ""
+        self._prompt_style = None
+        self._refresh_status_style()
         
         # Initialize components
         self.ui = UI(self.console)
-        self.animator = Animator(self.console)
+        # animator and eggs are created on first use (below)
         self.ai = get_ai_engine()
         self.memory = get_memory()
         self.mood = get_mood_detector()
         self.commands = get_command_parser()
         self.achievements = get_achievement_tracker()
-        self.eggs = get_easter_egg_hunter()
         
         # State
         self.running = True
         self.focus_mode = False
-        self._last_message_time = time.time()
+        self._last_message_time = time.monotonic()
         
         # Loop Safety Guards
         self.response_rendered = False
         
-        # Setup signal handlers for graceful exit
-        signal.signal(signal.SIGINT, self._handle_interrupt)
-        if hasattr(signal, 'SIGTERM'):
-            signal.signal(signal.SIGTERM, self._handle_interrupt)
+        # Slash command name -> handler (see _handle_command)
+        self._cmd_table = {
+            "exit": self._cmd_exit,
+            "quit": self._cmd_exit,
+            "help": self._cmd_help,
+            "clear": self._cmd_clear,
+            "reset": self._cmd_reset,
+            "theme": self._cmd_theme,
+            "mode": self._cmd_mode,
+            "stats": self._cmd_stats,
+            "achievements": self._cmd_achievements,
+            "ach": self._cmd_achievements,
+            "sound": self._cmd_sound,
+            "focus": self._cmd_focus,
+            "export": self._cmd_export,
+            "play": self._cmd_play,
+            "name": self._cmd_name,
+            "bookmark": self._cmd_bookmark,
+            "bookmarks": self._cmd_bookmarks,
+            "about": self._cmd_about,
+            "hint": self._cmd_hint,
+        }
+        
+        # Achievement context accumulated during a turn (see _check_achievements)
+        self._ach_ctx: dict = {}
+        
+        # Post-response voice waveform is opt-in: it holds up the next
+        # prompt for half a second. Set NOVAMIND_WAVEFORM=1 to enable it.
+        self.show_waveform = os.getenv("NOVAMIND_WAVEFORM") == "1"
+        
+        self._exited = False
+        self._status_active = False  # "Thinking..." spinner is showing
+        
+        # Route Ctrl+C / SIGTERM to this instance's graceful exit
+        _install_exit_handlers(self)
+    
+    # ============================================
+    # LAZY COMPONENTS
+    # ============================================
+    # Imported on first access so a session that exits straight away
+    # never loads the animation or easter egg modules.
+    
+    @cached_property
+    def animator(self):
+        """Animation helper bound to the shared console"""
+        from core.animator import Animator
+        return Animator(self.console)
+    
+    @cached_property
+    def eggs(self):
+        """Global easter egg hunter"""
+        from core.easter_eggs import get_easter_egg_hunter
+        return get_easter_egg_hunter()
     
     def _handle_interrupt(self, signum, frame):
         """Handle Ctrl+C gracefully"""
+        if self._status_active:
+            # Unwind out of console.status first (see _handle_conversation)
+            raise KeyboardInterrupt
         self.console.print("\n")
         self.exit_gracefully()
         sys.exit(0)
@@ -144,6 +295,7 @@ class NovaMind:
         
         # Award first contact achievement
         self._check_achievements({"message_count": 1})
+        self._flush_achievements()
         
         # Main loop
         self._main_loop()
@@ -168,10 +320,6 @@ class NovaMind:
                 # Ctrl+D
                 self.exit_gracefully()
                 break
-            except KeyboardInterrupt:
-                # Ctrl+C (backup handler)
-                self.exit_gracefully()
-                break
             except Exception as e:
                 self.ui.show_error(f"Something went wrong: {str(e)[:50]}")
     
@@ -182,31 +330,75 @@ class NovaMind:
     def _get_input(self) -> str:
         """Get user input with styled prompt"""
         theme = self.style_manager.theme
-        stats = self.memory.get_session_summary()
         ach_display = self.achievements.get_progress()
         
-        # Show subtle status
-        self.console.print()
-        status = f"  💬 {stats['messages']} | 🏆 {ach_display} | 🎨 {self.memory.current_theme}"
-        self.console.print(Text(status, style=theme.muted))
+        # Show subtle status (only the message count is needed, so read the
+        # counter directly instead of building a full session summary).
+        # Written raw with the pre-rendered muted style; goes through the
+        # console's stream so the theme engine still sees the output.
+        memory = self.memory
+        out = self.console.file
+        out.write(
+            f"\n{self._muted_open}  💬 {memory.stats.message_count} | "
+            f"🏆 {ach_display} | 🎨 {memory.current_theme}{self._muted_close}\n"
+        )
+        out.flush()
         
         # Input prompt
-        try:
-            prompt = f"  {theme.emoji} You > "
+        prompt = f"  {theme.emoji} You > "
+        session = self._prompt_session
+        if session is not None:
+            try:
+                user_input = session.prompt(prompt, style=self._prompt_style)
+            except KeyboardInterrupt:
+                # prompt_toolkit reads Ctrl+C as a key, not as SIGINT
+                self._handle_interrupt(signal.SIGINT, None)
+            # prompt_toolkit resets attributes when done; restore the theme
+            self.theme_engine.ensure_background()
+        else:
             user_input = input(prompt)
-            return sanitize_input(user_input)
-        except (EOFError, KeyboardInterrupt):
-            raise
+        # The prompt and echoed input bypass the console stream
+        self.theme_engine.mark_dirty()
+        return sanitize_input(user_input)
+    
+    def _create_prompt_session(self):
+        """
+        Create a prompt_toolkit session with persistent history, or None
+        when prompt_toolkit isn't installed or we're not on a terminal.
+        prompt_toolkit is only imported in the interactive case.
+        """
+        if not (sys.stdin.isatty() and sys.stdout.isatty()):
+            return None
+        try:
+            from prompt_toolkit import PromptSession
+            from prompt_toolkit.history import FileHistory
+        except ImportError:
+            return None
+        
+        history_path = os.path.join(os.path.expanduser("~"), ".novamind_history")
+        try:
+            return PromptSession(history=FileHistory(history_path))
+        except Exception:
+            return None
     
     def _process_input(self, user_input: str):
-        """Process user input (command or message)"""
+        """Process user input, then award achievements once for the turn"""
+        self._ach_ctx = {}
+        self._route_input(user_input)
+        
+        # Skip if the turn ended the session (exit summary already shown)
+        if self.running:
+            self._flush_achievements()
+    
+    def _route_input(self, user_input: str):
+        """Route user input (command or message)"""
         # Handle empty input
         if not user_input.strip():
             self.ui.show_system_message("Say something! I'm listening... 👂")
             return
         
         # Track time for achievements
-        self._last_message_time = time.time()
+        self._last_message_time = time.monotonic()
         
         # Check if it's a command
         if self.commands.is_command(user_input):
@@ -235,194 +427,218 @@ class NovaMind:
         # Check achievements
         self._check_achievements({"command": cmd})
         
-        if cmd in ["exit", "quit"]:
-            self.exit_gracefully()
-            self.running = False
-            return
-        
-        elif cmd == "help":
-            help_text = self.commands.get_help_text()
-            self.ui.show_help(help_text)
-        
-        elif cmd == "clear":
-            # CRITICAL FIX: Use theme-safe clear that preserves background
-            self.theme_engine.clear_screen_safe()
-            self.ui.show_welcome(animate=False)
-            # Re-apply theme background after welcome screen
-            self._apply_current_theme_bg()
-            # Ensure background is active for subsequent output
-            self.theme_engine.ensure_background()
-        
-        elif cmd == "reset":
-            self.memory.clear()
-            self.ui.show_success("Conversation reset! Fresh start. 🌟")
-        
-        elif cmd == "theme":
-            if args:
-                target = args[0].lower()
-                theme_names = self.style_manager.get_theme_names()
-                selected_name = None
+        handler = self._cmd_table.get(cmd)
+        if handler is None:
+            self._cmd_unknown(cmd, args)
+        else:
+            handler(args)
+    
+    def _cmd_exit(self, args: list):
+        """Leave the chat with a session summary"""
+        self.exit_gracefully()
+        self.running = False
+    
+    def _cmd_help(self, args: list):
+        """Show the command reference"""
+        help_text = self.commands.get_help_text()
+        self.ui.show_help(help_text)
+    
+    def _cmd_clear(self, args: list):
+        """Clear the screen, keeping the theme background"""
+        # CRITICAL FIX: Use theme-safe clear that preserves background
+        self.theme_engine.clear_screen_safe()
+        self.ui.show_welcome(animate=False)
+        # Re-apply theme background after welcome screen
+        self._apply_current_theme_bg()
+        # Ensure background is active for subsequent output
+        self.theme_engine.ensure_background()
+    
+    def _cmd_reset(self, args: list):
+        """Forget the conversation so far"""
+        self.memory.clear()
+        self.ui.show_success("Conversation reset! Fresh start. 🌟")
+    
+    def _cmd_theme(self, args: list):
+        """Switch theme, or list themes with no argument"""
+        if args:
+            target = args[0].lower()
+            theme_names = self.style_manager.get_theme_names()
+            selected_name = None
+            
+            # Handle numeric selection
+            if target.isdigit():
+                idx = int(target) - 1
+                if 0 <= idx < len(theme_names):
+                    selected_name = theme_names[idx]
+            elif target in theme_names:
+                selected_name = target
+            
+            if selected_name and self.style_manager.switch_theme(selected_name):
+                self.memory.set_theme(selected_name)
                 
-                # Handle numeric selection
-                if target.isdigit():
-                    idx = int(target) - 1
-                    if 0 <= idx < len(theme_names):
-                        selected_name = theme_names[idx]
-                elif target in theme_names:
-                    selected_name = target
-                    
-                if selected_name and self.style_manager.switch_theme(selected_name):
-                    self.memory.set_theme(selected_name)
-                    
-                    # ============================================
-                    # CRITICAL FIX: DO NOT recreate Console/UI/Animator
-                    # Console recreation causes complete state loss and
-                    # triggers rendering bugs including token leaks.
-                    # 
-                    # Instead, we ONLY apply the new theme background.
-                    # The style_manager already updated, so Rich will
-                    # use new colors on subsequent prints.
-                    # ============================================
-                    
-                    # Apply theme background - this clears screen and applies new colors
-                    self._apply_current_theme_bg()
-                    
-                    # Re-apply background after any potential reset
-                    self.theme_engine.ensure_background()
-                    
-                    # Show success message AFTER theme is applied
-                    self.ui.show_success(f"Theme changed to {selected_name} {self.style_manager.theme.emoji}")
-
-                    # Display the new theme's logo
-                    from core.logos import get_logo, get_compact_logo
-                    import shutil
-
-                    term_width = shutil.get_terminal_size().columns
-                    if term_width >= 75:
-                        logo = get_logo(selected_name)
-                    else:
-                        logo = get_compact_logo(selected_name)
-                    
-                    from rich.align import Align
-                    self.console.print(Align.center(Text(logo, style=self.style_manager.theme.primary)))
-                    self.console.print()
-                    self._check_achievements({"current_theme": selected_name, "themes_used": self.memory.stats.themes_used})
-                else:
-                    self.ui.show_error(f"Unknown theme. Use /theme to list available options.")
-            else:
-                self.console.print("\n🎨 Available Themes:", style="bold")
-                self.console.print("Type /theme <name> or /theme <number> to switch.\n")
+                # ============================================
+                # CRITICAL FIX: DO NOT recreate Console/UI/Animator
+                # Console recreation causes complete state loss and
+                # triggers rendering bugs including token leaks.
+                # 
+                # Instead, we swap the console's named styles in place
+                # and apply the new theme background. UI/Animator read
+                # style_manager.theme on every call, so they follow.
+                # ============================================
+                self._sync_console_theme()
+                self._refresh_status_style()
                 
-                # Show preview list with real colors
-                from rich.style import Style as RichStyle
+                # Apply theme background - this clears screen and applies new colors
+                self._apply_current_theme_bg()
                 
-                for idx, name in enumerate(self.style_manager.get_theme_names(), 1):
-                    t = THEMES[name]
-                    # Create a preview block with the theme's background color
-                    # We use the RGB values to create a rich style
-                    r, g, b = t.bg_rgb
-                    preview_style = RichStyle(bgcolor=f"rgb({r},{g},{b})", color=t.user_text)
-                    
-                    self.console.print(f"  {idx}. ", end="")
-                    self.console.print(f" {t.emoji} {t.name:<20} ", style=preview_style)
-                self.console.print()
-        
-        elif cmd == "mode":
-            if args:
-                mode_name = args[0].lower()
-                if self.ai.set_mode(mode_name):
-                    self.memory.set_mode(mode_name)
-                    self.ui.show_success(f"Mode set to {mode_name} ✨")
-                else:
-                    self.ui.show_error(f"Unknown mode. Try: {', '.join(self.ai.get_available_modes())}")
-            else:
-                self.console.print("Available modes:")
-                self.console.print(self.commands.get_mode_list())
-        
-        elif cmd == "stats":
-            stats = self.memory.get_session_summary()
-            self.ui.show_stats(stats)
-        
-        elif cmd in ["achievements", "ach"]:
-            unlocked = self.achievements.get_unlocked()
-            locked = self.achievements.get_locked()
-            progress = self.achievements.get_progress()
-            self.ui.show_achievements(unlocked, locked, progress)
-        
-        elif cmd == "sound":
-            if args and args[0].lower() in ["on", "off"]:
-                enabled = args[0].lower() == "on"
-                self.animator.set_sound(enabled)
+                # Re-apply background after any potential reset
+                self.theme_engine.ensure_background()
                 
-                # Also update global sound engine
-                from core.sounds import get_sound_simulator
-                sim = get_sound_simulator()
-                sim.set_enabled(enabled)
+                # Show success message AFTER theme is applied
+                self.ui.show_success(f"Theme changed to {selected_name} {self.style_manager.theme.emoji}")
                 
-                if enabled:
-                    sim.play_notification_sound()
+                # Display the new theme's logo
+                from core.logos import get_logo, get_compact_logo
+                import shutil
                 
-                self.ui.show_success(f"Sound effects {'enabled' if enabled else 'disabled'}")
-            else:
-                self.ui.show_system_message("Usage: /sound on|off")
-        
-        elif cmd == "focus":
-            if args and args[0].lower() in ["on", "off"]:
-                enabled = args[0].lower() == "on"
-                self.focus_mode = enabled
-                self.animator.set_focus_mode(enabled)
-                self.ui.show_success(f"Focus mode {'enabled' if enabled else 'disabled'}")
-            else:
-                self.ui.show_system_message("Usage: /focus on|off")
-        
-        elif cmd == "export":
-            if args:
-                format_type = args[0].lower()
-                self._export_chat(format_type)
-            else:
-                self.ui.show_system_message("Usage: /export txt|md|json")
-        
-        elif cmd == "play":
-            if args:
-                game = args[0].lower()
-                self._play_game(game)
-            else:
-                self.console.print("Available games:")
-                self.console.print(self.commands.get_game_list())
-        
-        elif cmd == "name":
-            if args:
-                name = " ".join(args)
-                self.memory.set_user_name(name)
-                self.ui.show_success(f"Nice to meet you, {name}! 👋")
-            else:
-                self.ui.show_system_message("Usage: /name <your_name>")
-        
-        elif cmd == "bookmark":
-            if self.memory.add_bookmark():
-                self.ui.show_success("Bookmark saved! 📌")
-                self._check_achievements({"bookmark_count": len(self.memory.bookmarks)})
+                term_width = shutil.get_terminal_size().columns
+                if term_width >= 75:
+                    logo = get_logo(selected_name)
+                else:
+                    logo = get_compact_logo(selected_name)
+                
+                from rich.align import Align
+                self.console.print(Align.center(Text(logo, style=self.style_manager.theme.primary)))
+                self.console.print()
+                self._check_achievements({"current_theme": selected_name, "themes_used": self.memory.stats.themes_used})
             else:
-                self.ui.show_error("Nothing to bookmark yet!")
-        
-        elif cmd == "bookmarks":
-            bookmarks = self.memory.get_bookmarks()
-            if bookmarks:
-                self.console.print("\n📚 Your Bookmarks:")
-                for i, bm in enumerate(bookmarks, 1):
-                    self.console.print(f"  {i}. {bm.message_preview}")
+                self.ui.show_error(f"Unknown theme. Use /theme to list available options.")
+        else:
+            self.console.print("\n🎨 Available Themes:", style="bold")
+            self.console.print("Type /theme <name> or /theme <number> to switch.\n")
+            
+            # Show preview list with real colors
+            from rich.style import Style as RichStyle
+            
+            for idx, name in enumerate(self.style_manager.get_theme_names(), 1):
+                t = THEMES[name]
+                # Create a preview block with the theme's background color
+                # We use the RGB values to create a rich style
+                r, g, b = t.bg_rgb
+                preview_style = RichStyle(bgcolor=f"rgb({r},{g},{b})", color=t.user_text)
+                
+                self.console.print(f"  {idx}. ", end="")
+                self.console.print(f" {t.emoji} {t.name:<20} ", style=preview_style)
+            self.console.print()
+    
+    def _cmd_mode(self, args: list):
+        """Switch AI personality mode, or list modes"""
+        if args:
+            mode_name = args[0].lower()
+            if self.ai.set_mode(mode_name):
+                self.memory.set_mode(mode_name)
+                self.ui.show_success(f"Mode set to {mode_name} ✨")
             else:
-                self.ui.show_system_message("No bookmarks yet. Use /bookmark to save a moment!")
-        
-        elif cmd == "about":
-            self.ui.show_about()
-        
-        elif cmd == "hint":
-            hint = self.eggs.get_random_hint()
-            self.ui.show_system_message(f"🔮 Hint: {hint}")
-        
+                self.ui.show_error(f"Unknown mode. Try: {', '.join(self.ai.get_available_modes())}")
+        else:
+            self.console.print("Available modes:")
+            self.console.print(self.commands.get_mode_list())
+    
+    def _cmd_stats(self, args: list):
+        """Show session statistics"""
+        stats = self.memory.get_session_summary()
+        self.ui.show_stats(stats)
+    
+    def _cmd_achievements(self, args: list):
+        """Show unlocked and locked achievements"""
+        unlocked = self.achievements.get_unlocked()
+        locked = self.achievements.get_locked()
+        progress = self.achievements.get_progress()
+        self.ui.show_achievements(unlocked, locked, progress)
+    
+    def _cmd_sound(self, args: list):
+        """Toggle sound effects"""
+        if args and args[0].lower() in ["on", "off"]:
+            enabled = args[0].lower() == "on"
+            self.animator.set_sound(enabled)
+            
+            # Also update global sound engine
+            sim = get_sound_simulator()
+            sim.set_enabled(enabled)
+            
+            if enabled:
+                sim.play_notification_sound()
+            
+            self.ui.show_success(f"Sound effects {'enabled' if enabled else 'disabled'}")
+        else:
+            self.ui.show_system_message("Usage: /sound on|off")
+    
+    def _cmd_focus(self, args: list):
+        """Toggle focus mode (no animations)"""
+        if args and args[0].lower() in ["on", "off"]:
+            enabled = args[0].lower() == "on"
+            self.focus_mode = enabled
+            self.animator.set_focus_mode(enabled)
+            self.ui.show_success(f"Focus mode {'enabled' if enabled else 'disabled'}")
+        else:
+            self.ui.show_system_message("Usage: /focus on|off")
+    
+    def _cmd_export(self, args: list):
+        """Export the chat as txt, md or json"""
+        if args:
+            format_type = args[0].lower()
+            self._export_chat(format_type)
+        else:
+            self.ui.show_system_message("Usage: /export txt|md|json")
+    
+    def _cmd_play(self, args: list):
+        """Start a mini-game, or list games"""
+        if args:
+            game = args[0].lower()
+            self._play_game(game)
+        else:
+            self.console.print("Available games:")
+            self.console.print(self.commands.get_game_list())
+    
+    def _cmd_name(self, args: list):
+        """Set the user's display name"""
+        if args:
+            name = " ".join(args)
+            self.memory.set_user_name(name)
+            self.ui.show_success(f"Nice to meet you, {name}! 👋")
         else:
-            self.ui.show_error(f"Unknown command: /{cmd}. Try /help")
+            self.ui.show_system_message("Usage: /name <your_name>")
+    
+    def _cmd_bookmark(self, args: list):
+        """Bookmark the latest message"""
+        if self.memory.add_bookmark():
+            self.ui.show_success("Bookmark saved! 📌")
+            self._check_achievements({"bookmark_count": len(self.memory.bookmarks)})
+        else:
+            self.ui.show_error("Nothing to bookmark yet!")
+    
+    def _cmd_bookmarks(self, args: list):
+        """List saved bookmarks"""
+        bookmarks = self.memory.get_bookmarks()
+        if bookmarks:
+            self.console.print("\n📚 Your Bookmarks:")
+            for i, bm in enumerate(bookmarks, 1):
+                self.console.print(f"  {i}. {bm.message_preview}")
+        else:
+            self.ui.show_system_message("No bookmarks yet. Use /bookmark to save a moment!")
+    
+    def _cmd_about(self, args: list):
+        """Show the about panel"""
+        self.ui.show_about()
+    
+    def _cmd_hint(self, args: list):
+        """Show a random easter egg hint"""
+        hint = self.eggs.get_random_hint()
+        self.ui.show_system_message(f"🔮 Hint: {hint}")
+    
+    def _cmd_unknown(self, cmd: str, args: list):
+        """Report an unrecognised command"""
+        self.ui.show_error(f"Unknown command: /{cmd}. Try /help")
     
     # ============================================
     # CONVERSATION
@@ -433,35 +649,44 @@ class NovaMind:
         # Display user message
         self.ui.show_user_message(user_input, self.memory.user_name)
         
-        # Detect mood
-        detected_mood = self.mood.analyze(user_input)
+        # Detect mood, question-ness (for achievements) and response tone
+        analysis = self.mood.analyze_message(user_input)
+        detected_mood = analysis.mood
         mood_emoji = detected_mood.emoji
         
         # Store user message
         self.memory.add_message("user", user_input, detected_mood.name)
-        self.mood.record_mood(time.time())
-        
-        # Check for questions (for achievements)
-        is_q = is_question(user_input)
-        
-        # Thinking animation
-        self.console.print()
-        frames = self.style_manager.get_spinner_frames("dots")
-        theme = self.style_manager.theme
-        
-        # Show thinking
-        if not self.focus_mode:
-            for i in range(8):
-                frame = frames[i % len(frames)]
-                self.console.print(f"  {frame} Thinking...", style=theme.system_text, end="\r")
-                time.sleep(0.15)
-            self.console.print(" " * 30, end="\r")
+        self.mood.record_mood(time.monotonic())
         
         # Get AI response
+        self.console.print()
         context = self.memory.get_context_for_ai()
-        mood_hint = self.mood.suggest_response_tone()
+        mood_hint = analysis.tone_hint
         
-        response = self.ai.generate_response(user_input, context, mood_hint)
+        if self.focus_mode:
+            response = self.ai.generate_response(user_input, context, mood_hint)
+        else:
+            # Thinking spinner runs WHILE the request is in flight, so it
+            # costs nothing beyond the model's own latency
+            theme = self.style_manager.theme
+            future = self._run_in_background(
+                self.ai.generate_response, user_input, context, mood_hint
+            )
+            try:
+                self._status_active = True
+                try:
+                    with self.console.status(
+                        Text("Thinking...", style=theme.system_text),
+                        spinner="dots",
+                        spinner_style=theme.system_text,
+                    ):
+                        response = future.result()
+                finally:
+                    self._status_active = False
+            except KeyboardInterrupt:
+                # Raised by _handle_interrupt so the spinner (and its
+                # stdout redirection) is torn down before the exit screen
+                self._handle_interrupt(signal.SIGINT, None)
         
         # CRITICAL: Sanitize response before ANY rendering
         # This strips model tokens like <|im_start|> that must NEVER be displayed
@@ -476,21 +701,41 @@ class NovaMind:
         # Store AI response
         self.memory.add_message("assistant", response)
         
-        # Voice waveform (quick animation)
-        if not self.focus_mode:
-            self.animator.animate_waveform(0.5)
-        
         # Check achievements
         stats = self.memory.get_session_summary()
         self._check_achievements({
             "message_count": stats["messages"],
             "total_words": stats["words"],
             "session_minutes": stats["duration_minutes"],
-            "is_question": is_q,
+            "is_question": analysis.is_question,
             "mood": detected_mood.name,
             "current_theme": self.memory.current_theme,
             "themes_used": self.memory.stats.themes_used,
         })
+        # Award now so unlock panels print before the waveform starts
+        self._flush_achievements()
+        
+        # Voice waveform (quick animation, opt-in)
+        if self.show_waveform and not self.focus_mode and self.console.is_terminal:
+            self.animator.animate_waveform(0.5)
+    
+    def _run_in_background(self, func, *args) -> Future:
+        """
+        Run a blocking call on a daemon thread and return its Future.
+        
+        A daemon thread (rather than a ThreadPoolExecutor worker) means a
+        slow network call never holds up Ctrl+C / exit.
+        """
+        future: Future = Future()
+        
+        def runner():
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=runner, daemon=True, name="AIRequest").start()
+        return future
     
     def _render_response_safely(self, response: str, mood_emoji: str):
         """Render response with safety checks to prevent duplication"""
@@ -514,7 +759,6 @@ class NovaMind:
         
         Each character is printed EXACTLY ONCE with proper box boundaries.
         """
-        from core.sounds import get_sound_simulator
         from core.text_renderer import prepare_response_for_box, visible_width
         import shutil
         
@@ -522,6 +766,8 @@ class NovaMind:
         current_mood = self.mood.get_current_mood()
         speed_mod = current_mood.speed_modifier
         sound = get_sound_simulator()
+        # Resolve sound dispatch once per response rather than per character
+        play_keystroke = sound.play_keystroke_sound if sound.enabled else None
         
         # ============================================
         # STEP 1: Calculate box dimensions
@@ -558,63 +804,82 @@ class NovaMind:
         dashes_needed = box_width - prefix_width - suffix_width
         dashes_needed = max(0, dashes_needed)
         
-        print(f"{bg_code}{header_prefix_text}{'─' * dashes_needed}╮", flush=True)
         # Top Empty Line: "  │" + spaces + "│"
         # Width: 3 ("  │") + (box_width - 3 - 2) + 2 (" │") ...
         # Standardize content row: "  │  " (5) + content + " │" (2)
         # top empty line should act like a content line but valid
         # inner_width is box_width - 7
         # So printing 5 chars prefix + inner_width spaces + 2 chars suffix = box_width
-        print(f"{bg_code}  │  {' ' * inner_width} │", flush=True)
+        blank_row = f"{bg_code}  │  {' ' * inner_width} │\n"
+        
+        # Header and top empty line go out in a single write
+        # Raw writes go through the console's stream so the theme engine
+        # sees them (see DirtyTrackingStream)
+        out = self.console.file
+        write = out.write
+        flush = out.flush
+        write(f"{bg_code}{header_prefix_text}{'─' * dashes_needed}╮\n{blank_row}")
+        flush()
         
         # ============================================
         # STEP 4: Render each wrapped line with typing animation
         # ============================================
+        # Hot loop below only touches locals
+        delay_class = TYPING_DELAY_CLASS
+        delays = [d * speed_mod for d in TYPING_CLASS_DELAYS]
+        default_delay = delays[0]
+        min_sleep = TYPING_MIN_SLEEP
+        tokenize = TYPING_TOKEN_PATTERN.findall
+        perf_counter = time.perf_counter
+        sleep = time.sleep
+        deadline = perf_counter()
+        
         for line_idx, line in enumerate(wrapped_lines):
             # Print line prefix with background code "  │  "
-            print(f"{bg_code}  │  ", end="", flush=True)
+            write(f"{bg_code}  │  ")
+            flush()
             
-            # Animate each character in this line
-            for char in line:
-                print(char, end="", flush=True)
+            # Animate word by word: one write per token, advancing a
+            # deadline by the sum of the per-character delays
+            for token in tokenize(line):
+                # Write only the new token; nothing already on screen is re-sent
+                write(token)
+                flush()
                 
-                # Skip delay and sound for ANSI escape codes
-                if char == '\x1b':
-                    continue
+                delay = 0.0
+                for char in token:
+                    code = ord(char)
+                    delay += delays[delay_class[code]] if code < 256 else default_delay
                 
-                # Play typing sound for visible characters
-                if char.isalnum() and sound.enabled:
-                    sound.play_keystroke_sound()
+                # Play typing sound for visible words
+                if play_keystroke is not None and any(c.isalnum() for c in token):
+                    play_keystroke()
                 
-                # Variable delay based on character type
-                if char in ".!?":
-                    time.sleep(0.08 * speed_mod)
-                elif char in ",;:":
-                    time.sleep(0.04 * speed_mod)
-                elif char == " ":
-                    time.sleep(0.01 * speed_mod)
-                else:
-                    time.sleep(0.02 * speed_mod)
+                # Sleep until the cumulative deadline rather than a fixed
+                # amount per token, so write time and sleep overshoot don't
+                # add up; tiny debts are carried over to the next token
+                deadline += delay
+                slack = deadline - perf_counter()
+                if slack > min_sleep:
+                    sleep(slack)
             
             # Pad the rest of the line to align right border
             visible = visible_width(line)
             padding_len = max(0, inner_width - visible)
             padding = ' ' * padding_len
-            print(f"{padding} │", flush=True)
+            write(f"{padding} │\n")
+            flush()
         
         # ============================================
         # STEP 5: Render box footer with background code
         #Footer: "  ╰" + dashes + "╯"
         # ============================================
-        # Bottom Empty Line
-        print(f"{bg_code}  │  {' ' * inner_width} │", flush=True)
-        
-        # Border
-        # Prefix "  ╰" (width 3)
-        # Suffix "╯" (width 1)
+        # Bottom empty line and border, in a single write
+        # Border: prefix "  ╰" (width 3), suffix "╯" (width 1)
         # Dashes = box_width - 4
         dashes_len = max(0, box_width - 4)
-        print(f"{bg_code}  ╰{'─' * dashes_len}╯", flush=True)
+        write(f"{blank_row}{bg_code}  ╰{'─' * dashes_len}╯\n")
+        flush()
     
     # ============================================
     # EASTER EGGS
@@ -643,6 +908,8 @@ class NovaMind:
     
     def _play_game(self, game: str):
         """Play a mini-game"""
+        from core.easter_eggs import get_random_joke, get_random_fortune, get_8ball_response
+        
         if game == "trivia":
             self._play_trivia()
         elif game == "fortune":
@@ -675,7 +942,18 @@ class NovaMind:
     # ============================================
     
     def _check_achievements(self, context: dict):
-        """Check and award achievements"""
+        """
+        Queue achievement context for this turn.
+        Handlers may call this several times; the merged context is
+        evaluated once by _flush_achievements.
+        """
+        self._ach_ctx.update(context)
+    
+    def _flush_achievements(self):
+        """Check and award achievements for the queued context"""
+        if not self._ach_ctx:
+            return
+        context, self._ach_ctx = self._ach_ctx, {}
         newly_unlocked = self.achievements.check_and_award(context)
         
         for ach in newly_unlocked:
@@ -688,23 +966,21 @@ class NovaMind:
     
     def _export_chat(self, format_type: str):
         """Export chat history"""
-        from core.utils import save_to_file, save_json, get_exports_directory
+        from core.utils import save_chunks, save_json, get_exports_directory
         
         exports_dir = get_exports_directory()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         if format_type == "txt":
-            content = self.memory.export_txt()
             filename = f"novamind_chat_{timestamp}.txt"
-            if save_to_file(content, filename, exports_dir):
+            if save_chunks(self.memory.iter_export_txt(), filename, exports_dir):
                 self.ui.show_success(f"Exported to {exports_dir}/{filename}")
             else:
                 self.ui.show_error("Export failed!")
         
         elif format_type == "md":
-            content = self.memory.export_markdown()
             filename = f"novamind_chat_{timestamp}.md"
-            if save_to_file(content, filename, exports_dir):
+            if save_chunks(self.memory.iter_export_markdown(), filename, exports_dir):
                 self.ui.show_success(f"Exported to {exports_dir}/{filename}")
             else:
                 self.ui.show_error("Export failed!")
@@ -720,6 +996,35 @@ class NovaMind:
         else:
             self.ui.show_error("Unknown format. Try: txt, md, json")
     
+    def _sync_console_theme(self):
+        """
+        Point the persistent Console's named styles ("primary", "ai", ...)
+        at the current theme, replacing any theme pushed by a previous
+        switch so the theme stack never grows.
+        """
+        if self._console_theme_pushed:
+            self.console.pop_theme()
+        self.console.push_theme(self.style_manager.rich_theme)
+        self._console_theme_pushed = True
+    
+    def _refresh_status_style(self):
+        """
+        Pre-render the ANSI open/close sequences for theme.muted so the
+        per-prompt status line can be written without going through Rich.
+        Empty when the console has no color support. Also rebuilds the
+        prompt_toolkit style that keeps the theme background behind the
+        prompt and typed text.
+        """
+        theme = self.style_manager.theme
+        with self.console.capture() as capture:
+            self.console.print(Text("\0", style=theme.muted), end="")
+        self._muted_open, _, self._muted_close = capture.get().partition("\0")
+        
+        if self._prompt_session is not None:
+            from prompt_toolkit.styles import Style as PromptStyle
+            r, g, b = theme.bg_rgb
+            self._prompt_style = PromptStyle.from_dict({"": f"bg:#{r:02x}{g:02x}{b:02x}"})
+    
     def _apply_current_theme_bg(self):
         """
         Apply current theme's background color to the ENTIRE terminal viewport.
@@ -745,6 +1050,9 @@ class NovaMind:
     
     def exit_gracefully(self):
         """Show exit summary and cleanup"""
+        if self._exited:
+            return
+        self._exited = True
         stats = self.memory.get_session_summary()
         mood_journey = self.mood.get_mood_journey()
         